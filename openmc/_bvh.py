@@ -0,0 +1,233 @@
+"""Bounding volume hierarchy over axis-aligned bounding boxes
+
+This is used internally to quickly discard geometric entities whose bounding
+box does not contain a given point before more expensive region containment
+checks are carried out.
+
+"""
+import numpy as np
+
+# Numba is an optional dependency used to compile the tree traversal kernel
+try:
+    from numba import njit
+    _have_numba = True
+except ImportError:
+    _have_numba = False
+
+# Finite stand-in for infinite box coordinates when computing box centers
+_BIG = 1.0e300
+
+
+def _aabb_traverse(p, bmins, bmaxs, left, right, leaf_ids, out):
+    """Traverse a bounding volume hierarchy and collect boxes containing a point
+
+    Parameters
+    ----------
+    p : numpy.ndarray
+        Cartesian coordinates of the point
+    bmins, bmaxs : numpy.ndarray
+        Lower-left and upper-right coordinates of each node with shape (M, 3)
+    left, right : numpy.ndarray
+        Child node indices of each node, or -1 for leaf nodes
+    leaf_ids : numpy.ndarray
+        Index of the box held by each leaf node, or -1 for interior nodes
+    out : numpy.ndarray
+        Array that indices of boxes containing the point are written to
+
+    Returns
+    -------
+    int
+        Number of indices written to `out`
+
+    """
+    n_hits = 0
+    stack = np.empty(64, np.int32)
+    stack[0] = 0
+    top = 1
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        inside = True
+        for k in range(3):
+            # Written so that NaN coordinates are never inside a box
+            if not (p[k] >= bmins[node, k] and p[k] <= bmaxs[node, k]):
+                inside = False
+                break
+        if inside:
+            leaf = leaf_ids[node]
+            if leaf >= 0:
+                out[n_hits] = leaf
+                n_hits += 1
+            else:
+                stack[top] = right[node]
+                stack[top + 1] = left[node]
+                top += 2
+    return n_hits
+
+
+def _points_in_box(points, lower_left, upper_right, out):
+    """Determine which points lie within a single axis-aligned box
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Cartesian coordinates of the points with shape (N, 3)
+    lower_left, upper_right : numpy.ndarray
+        Lower-left and upper-right coordinates of the box
+    out : numpy.ndarray
+        Boolean array of length N that the results are written to
+
+    """
+    for i in range(points.shape[0]):
+        inside = True
+        for k in range(3):
+            if not (points[i, k] >= lower_left[k] and
+                    points[i, k] <= upper_right[k]):
+                inside = False
+                break
+        out[i] = inside
+
+
+# Boxes may have infinite extents, so fastmath cannot be used here
+if _have_numba:
+    _aabb_traverse = njit(cache=True)(_aabb_traverse)
+    _points_in_box = njit(cache=True)(_points_in_box)
+
+
+def points_in_box(points, lower_left, upper_right):
+    """Determine which points lie within an axis-aligned box, including its
+    faces
+
+    Parameters
+    ----------
+    points : numpy.ndarray
+        Cartesian coordinates of the points with shape (N, 3)
+    lower_left, upper_right : numpy.ndarray
+        Lower-left and upper-right coordinates of the box
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array indicating whether each point is in the box
+
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if _have_numba:
+        out = np.empty(len(points), dtype=bool)
+        _points_in_box(np.ascontiguousarray(points),
+                       np.asarray(lower_left, dtype=np.float64),
+                       np.asarray(upper_right, dtype=np.float64), out)
+        return out
+    return np.all((points >= lower_left) & (points <= upper_right), axis=1)
+
+
+class BoundingVolumeHierarchy:
+    """Binary tree of axis-aligned bounding boxes built by median splitting.
+
+    Nodes are stored in a structure-of-arrays layout where node 0 is the root.
+    Each leaf node holds exactly one of the boxes used to build the tree.
+
+    Parameters
+    ----------
+    lower_left : numpy.ndarray
+        Lower-left coordinates of each box with shape (N, 3)
+    upper_right : numpy.ndarray
+        Upper-right coordinates of each box with shape (N, 3)
+
+    Attributes
+    ----------
+    box_lower_left : numpy.ndarray
+        Lower-left coordinates of each box used to build the tree
+    box_upper_right : numpy.ndarray
+        Upper-right coordinates of each box used to build the tree
+    lower_left : numpy.ndarray
+        Lower-left coordinates of the box enclosing each node
+    upper_right : numpy.ndarray
+        Upper-right coordinates of the box enclosing each node
+    left : numpy.ndarray
+        Index of the left child of each node or -1 for leaf nodes
+    right : numpy.ndarray
+        Index of the right child of each node or -1 for leaf nodes
+    leaf_ids : numpy.ndarray
+        Index of the box held by each leaf node or -1 for interior nodes
+
+    """
+
+    def __init__(self, lower_left, upper_right):
+        lower_left = np.asarray(lower_left, dtype=float).reshape(-1, 3)
+        upper_right = np.asarray(upper_right, dtype=float).reshape(-1, 3)
+        n = len(lower_left)
+        self.box_lower_left = lower_left
+        self.box_upper_right = upper_right
+
+        # A binary tree with n leaves always has 2n - 1 nodes
+        n_nodes = max(2*n - 1, 0)
+        self.lower_left = np.empty((n_nodes, 3))
+        self.upper_right = np.empty((n_nodes, 3))
+        self.left = np.full(n_nodes, -1, dtype=np.int32)
+        self.right = np.full(n_nodes, -1, dtype=np.int32)
+        self.leaf_ids = np.full(n_nodes, -1, dtype=np.int32)
+        self._hits = np.empty(n, dtype=np.int32)
+        if n == 0:
+            return
+
+        # Box centers are used to sort boxes when splitting a node. Unbounded
+        # directions are replaced with large finite values so that sorting and
+        # spread calculations remain well-defined.
+        with np.errstate(invalid='ignore'):
+            centers = 0.5*(lower_left + upper_right)
+        centers = np.nan_to_num(centers, nan=0.0, posinf=_BIG, neginf=-_BIG)
+
+        stack = [(0, np.arange(n))]
+        next_node = 1
+        while stack:
+            node, ids = stack.pop()
+            self.lower_left[node] = lower_left[ids].min(axis=0)
+            self.upper_right[node] = upper_right[ids].max(axis=0)
+            if len(ids) == 1:
+                self.leaf_ids[node] = ids[0]
+                continue
+
+            # Split at the median along the axis with the largest spread
+            c = centers[ids]
+            axis = np.argmax(c.max(axis=0) - c.min(axis=0))
+            ids = ids[np.argsort(c[:, axis], kind='stable')]
+            half = len(ids) // 2
+            self.left[node] = next_node
+            self.right[node] = next_node + 1
+            stack.append((next_node, ids[:half]))
+            stack.append((next_node + 1, ids[half:]))
+            next_node += 2
+
+    def __len__(self):
+        return len(self.leaf_ids)
+
+    def query(self, point):
+        """Find the boxes which contain a given point
+
+        Parameters
+        ----------
+        point : numpy.ndarray
+            Cartesian coordinates of the point
+
+        Returns
+        -------
+        list of int
+            Indices of the boxes containing the point in ascending order
+
+        """
+        if len(self) == 0:
+            return []
+
+        if _have_numba:
+            n_hits = _aabb_traverse(
+                np.asarray(point, dtype=np.float64), self.lower_left,
+                self.upper_right, self.left, self.right, self.leaf_ids,
+                self._hits)
+            return sorted(self._hits[:n_hits].tolist())
+
+        # Without Numba, walking the tree node by node in Python is slower
+        # than checking all boxes at once with NumPy
+        inside = ((point >= self.box_lower_left) &
+                  (point <= self.box_upper_right)).all(axis=1)
+        return inside.nonzero()[0].tolist()
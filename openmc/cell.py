@@ -10,7 +10,7 @@ from uncertainties import UFloat
 import openmc
 import openmc.checkvalue as cv
 from ._xml import get_text
-from .mixin import IDManagerMixin
+from .mixin import GeometryRevision, IDManagerMixin
 from .region import Region, Complement
 from .surface import Halfspace
 
@@ -101,10 +101,13 @@ class Cell(IDManagerMixin):
         # Initialize Cell class attributes
         self.id = cell_id
         self.name = name
-        self.fill = fill
-        self.region = region
+        # The property setters are bypassed since a new cell cannot yet be
+        # part of any geometry whose derived data has been cached
+        self._set_fill(fill)
+        self._set_region(region)
         self._rotation = None
         self._rotation_matrix = None
+        self._inv_affine = None
         self._temperature = None
         self._translation = None
         self._paths = None
@@ -270,6 +273,11 @@ class Cell(IDManagerMixin):
 
     @fill.setter
     def fill(self, fill):
+        self._set_fill(fill)
+        GeometryRevision.bump()
+
+    def _set_fill(self, fill):
+        """Validate and assign the fill without bumping the geometry revision"""
         if fill is not None:
             if isinstance(fill, Iterable):
                 for i, f in enumerate(fill):
@@ -291,6 +299,7 @@ class Cell(IDManagerMixin):
     def rotation(self, rotation):
         cv.check_length('cell rotation', rotation, 3)
         self._rotation = np.asarray(rotation)
+        self._inv_affine = None
 
         # Save rotation matrix -- the reason we do this instead of having it be
         # automatically calculated when the rotation_matrix property is accessed
@@ -313,6 +322,7 @@ class Cell(IDManagerMixin):
         cv.check_type('cell translation', translation, Iterable, Real)
         cv.check_length('cell translation', translation, 3)
         self._translation = np.asarray(translation)
+        self._inv_affine = None
 
     @temperature.setter
     def temperature(self, temperature):
@@ -336,6 +346,12 @@ class Cell(IDManagerMixin):
 
     @region.setter
     def region(self, region):
+        self._set_region(region)
+        GeometryRevision.bump()
+
+    def _set_region(self, region):
+        """Validate and assign the region without bumping the geometry
+        revision"""
         if region is not None:
             cv.check_type('cell region', region, Region)
         self._region = region
@@ -370,6 +386,41 @@ class Cell(IDManagerMixin):
         else:
             raise ValueError('No volume information found for this cell.')
 
+    def _apply_inverse_transform(self, points):
+        """Transform coordinates from the universe containing the cell to the
+        local coordinates of the universe filling it
+
+        The translation and rotation of the cell are combined into a single
+        affine transformation that is computed once and reused.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            Cartesian coordinates of a point with shape (3,) or of several
+            points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed coordinates
+
+        """
+        if self._translation is None and self._rotation is None:
+            return points
+
+        if self._inv_affine is None:
+            if self._rotation is not None:
+                matrix = self._rotation_matrix
+            else:
+                matrix = np.identity(3)
+            offset = np.zeros(3)
+            if self._translation is not None:
+                offset = -matrix @ self._translation
+            self._inv_affine = np.column_stack((matrix, offset))
+
+        affine = self._inv_affine
+        return points @ affine[:, :3].T + affine[:, 3]
+
     def get_nuclides(self):
         """Returns all nuclides in the cell
 
@@ -427,17 +478,18 @@ class Cell(IDManagerMixin):
         """
 
         cells = OrderedDict()
+        self._collect_cells(cells, set() if memo is None else memo)
+        return cells
 
-        if memo and self in memo:
-            return cells
-
-        if memo is not None:
-            memo.add(self)
+    def _collect_cells(self, cells, memo):
+        """Add all cells contained within this one to `cells`, skipping
+        objects that have already been visited"""
+        if self in memo:
+            return
+        memo.add(self)
 
         if self.fill_type in ('universe', 'lattice'):
-            cells.update(self.fill.get_all_cells(memo))
-
-        return cells
+            self.fill._collect_cells(cells, memo)
 
     def get_all_materials(self, memo=None):
         """Return all materials that are contained within the cell
@@ -450,6 +502,11 @@ class Cell(IDManagerMixin):
 
         """
         materials = OrderedDict()
+        self._collect_materials(materials, set() if memo is None else memo)
+        return materials
+
+    def _collect_materials(self, materials, memo):
+        """Add all materials contained within the cell to `materials`"""
         if self.fill_type == 'material':
             materials[self.fill.id] = self.fill
         elif self.fill_type == 'distribmat':
@@ -457,12 +514,11 @@ class Cell(IDManagerMixin):
                 if m is not None:
                     materials[m.id] = m
         else:
-            # Append all Cells in each Cell in the Universe to the dictionary
-            cells = self.get_all_cells(memo)
+            # Add the materials of all cells contained within this one
+            cells = {}
+            self._collect_cells(cells, memo)
             for cell in cells.values():
-                materials.update(cell.get_all_materials(memo))
-
-        return materials
+                cell._collect_materials(materials, memo)
 
     def get_all_universes(self):
         """Return all universes that are contained within this one if any of
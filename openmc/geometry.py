@@ -7,6 +7,14 @@ from pathlib import Path
 from xml.etree import ElementTree as ET
 import warnings
 
+# Try to use lxml for reading geometry files if it is available since it is
+# considerably faster than ElementTree for large files
+try:
+    import lxml.etree as lxml_etree
+    _have_lxml = True
+except ImportError:
+    _have_lxml = False
+
 import openmc
 import openmc._xml as xml
 from .checkvalue import check_type, check_less_than, check_greater_than, PathLike
@@ -181,6 +189,37 @@ class Geometry:
             Geometry object
 
         """
+        # Get surfaces
+        surfaces = {}
+        periodic = {}
+        for surface in elem.findall('surface'):
+            cls._read_surface(surface, surfaces, periodic)
+
+        # Get any DAGMC universes
+        str_memo = {}
+        dagmc_universes = [openmc.DAGMCUniverse.from_xml_element(e, str_memo)
+                           for e in elem.findall('dagmc_universe')]
+
+        return cls._from_xml_parts(elem, materials, surfaces, periodic,
+                                   dagmc_universes)
+
+    @staticmethod
+    def _read_surface(elem, surfaces, periodic):
+        """Create a surface from an XML element and add it to `surfaces`,
+        recording the ID of its periodic surface in `periodic` if it has one"""
+        s = openmc.Surface.from_xml_element(elem)
+        surfaces[s.id] = s
+
+        # Check for periodic surface
+        other_id = xml.get_text(elem, 'periodic_surface_id')
+        if other_id is not None:
+            periodic[s.id] = int(other_id)
+
+    @classmethod
+    def _from_xml_parts(cls, elem, materials, surfaces, periodic,
+                        dagmc_universes):
+        """Generate geometry from the lattice and cell subelements of an XML
+        element given surfaces and DAGMC universes that were already read"""
         mats = dict()
         if materials is not None:
             mats.update({str(m.id): m for m in materials})
@@ -194,25 +233,12 @@ class Geometry:
                 universes[univ_id] = univ
             return universes[univ_id]
 
-        # Get surfaces
-        surfaces = {}
-        periodic = {}
-        for surface in elem.findall('surface'):
-            s = openmc.Surface.from_xml_element(surface)
-            surfaces[s.id] = s
-
-            # Check for periodic surface
-            other_id = xml.get_text(surface, 'periodic_surface_id')
-            if other_id is not None:
-                periodic[s.id] = int(other_id)
-
         # Apply periodic surfaces
         for s1, s2 in periodic.items():
             surfaces[s1].periodic_surface = surfaces[s2]
 
         # Add any DAGMC universes
-        for e in elem.findall('dagmc_universe'):
-            dag_univ = openmc.DAGMCUniverse.from_xml_element(e)
+        for dag_univ in dagmc_universes:
             universes[dag_univ.id] = dag_univ
 
         # Dictionary that maps each universe to a list of cells/lattices that
@@ -285,10 +311,46 @@ class Geometry:
         if isinstance(materials, (str, os.PathLike)):
             materials = openmc.Materials.from_xml(materials)
 
-        tree = ET.parse(path)
-        root = tree.getroot()
+        if _have_lxml:
+            # Comments are removed to match the behavior of ElementTree
+            if isinstance(path, os.PathLike):
+                path = os.fspath(path)
+            context = lxml_etree.iterparse(
+                path, events=('start', 'end'), huge_tree=True,
+                remove_blank_text=True, remove_comments=True)
+        else:
+            context = ET.iterparse(path, events=('start', 'end'))
+
+        # Surfaces and DAGMC universes do not refer to other objects, so they
+        # are created as soon as they have been parsed and their elements are
+        # discarded. This keeps only cells and lattices in memory, which can
+        # only be created once all surfaces are known.
+        surfaces = {}
+        periodic = {}
+        dagmc_universes = []
+        str_memo = {}
+        root = None
+        depth = 0
+        for event, elem in context:
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            if elem.tag == 'surface':
+                cls._read_surface(elem, surfaces, periodic)
+            elif elem.tag == 'dagmc_universe':
+                dagmc_universes.append(
+                    openmc.DAGMCUniverse.from_xml_element(elem, str_memo))
+            else:
+                continue
+            root.remove(elem)
 
-        return cls.from_xml_element(root, materials)
+        return cls._from_xml_parts(root, materials, surfaces, periodic,
+                                   dagmc_universes)
 
     def find(self, point):
         """Find cells/universes/lattices which contain a given point
@@ -12,7 +12,7 @@ import numpy as np
 import openmc
 import openmc.checkvalue as cv
 from ._xml import get_text
-from .mixin import IDManagerMixin
+from .mixin import GeometryRevision, IDManagerMixin
 
 
 class Lattice(IDManagerMixin, ABC):
@@ -81,6 +81,7 @@ class Lattice(IDManagerMixin, ABC):
     def outer(self, outer):
         cv.check_type('outer universe', outer, openmc.UniverseBase)
         self._outer = outer
+        GeometryRevision.bump()
 
     @staticmethod
     def from_hdf5(group, universes):
@@ -170,19 +171,18 @@ class Lattice(IDManagerMixin, ABC):
 
         """
         cells = OrderedDict()
+        self._collect_cells(cells, set() if memo is None else memo)
+        return cells
 
-        if memo and self in memo:
-            return cells
-
-        if memo is not None:
-            memo.add(self)
-
-        unique_universes = self.get_unique_universes()
-
-        for universe in unique_universes.values():
-            cells.update(universe.get_all_cells(memo))
+    def _collect_cells(self, cells, memo):
+        """Add all cells contained within the lattice to `cells`, skipping
+        objects that have already been visited"""
+        if self in memo:
+            return
+        memo.add(self)
 
-        return cells
+        for universe in self.get_unique_universes().values():
+            universe._collect_cells(cells, memo)
 
     def get_all_materials(self, memo=None):
         """Return all materials that are contained within the lattice
@@ -195,12 +195,15 @@ class Lattice(IDManagerMixin, ABC):
 
         """
 
+        if memo is None:
+            memo = set()
         materials = OrderedDict()
 
-        # Append all Cells in each Cell in the Universe to the dictionary
-        cells = self.get_all_cells(memo)
+        # Add the materials of all cells contained within the lattice
+        cells = {}
+        self._collect_cells(cells, memo)
         for cell in cells.values():
-            materials.update(cell.get_all_materials(memo))
+            cell._collect_materials(materials, memo)
 
         return materials
 
@@ -491,6 +494,7 @@ class RectLattice(Lattice):
         cv.check_iterable_type('lattice universes', universes, openmc.UniverseBase,
                                min_depth=2, max_depth=3)
         self._universes = np.asarray(universes)
+        GeometryRevision.bump()
 
     def find_element(self, point):
         """Determine index of lattice element and local coordinates for a point
@@ -1199,6 +1203,7 @@ class HexLattice(Lattice):
         cv.check_iterable_type('lattice universes', universes, openmc.UniverseBase,
                                min_depth=2, max_depth=3)
         self._universes = universes
+        GeometryRevision.bump()
 
         # NOTE: This routine assumes that the user creates a "ragged" list of
         # lists, where each sub-list corresponds to one ring of Universes.
@@ -29,6 +29,29 @@ class IDWarning(UserWarning):
     pass
 
 
+class GeometryRevision:
+    """Counter of modifications made to geometry objects.
+
+    The counter is incremented whenever a change is made that can affect data
+    derived from the geometry, e.g., when cells are added to a universe or the
+    fill of a cell changes. Cached data can be considered valid as long as the
+    counter has the same value it had when the data was computed.
+
+    Attributes
+    ----------
+    value : int
+        Current revision number
+
+    """
+
+    value = 0
+
+    @classmethod
+    def bump(cls):
+        """Increment the revision number"""
+        cls.value += 1
+
+
 class IDManagerMixin:
     """A Class which automatically manages unique IDs.
 
@@ -6,6 +6,7 @@ from copy import deepcopy
 import numpy as np
 
 from .checkvalue import check_type
+from .mixin import GeometryRevision
 
 
 class Region(ABC):
@@ -364,9 +365,12 @@ class Intersection(Region, MutableSequence):
         self._nodes = list(nodes)
 
     def __and__(self, other):
-        new = Intersection(self)
-        new &= other
-        return new
+        # The nodes are passed to the constructor rather than added in place
+        # since a new region cannot yet be part of any geometry whose derived
+        # data has been cached
+        if isinstance(other, Intersection):
+            return Intersection(self[:] + other[:])
+        return Intersection(self[:] + [other])
 
     def __iand__(self, other):
         if isinstance(other, Intersection):
@@ -381,15 +385,18 @@ class Intersection(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        GeometryRevision.bump()
 
     def __delitem__(self, key):
         del self._nodes[key]
+        GeometryRevision.bump()
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        GeometryRevision.bump()
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -452,9 +459,12 @@ class Union(Region, MutableSequence):
         self._nodes = list(nodes)
 
     def __or__(self, other):
-        new = Union(self)
-        new |= other
-        return new
+        # The nodes are passed to the constructor rather than added in place
+        # since a new region cannot yet be part of any geometry whose derived
+        # data has been cached
+        if isinstance(other, Union):
+            return Union(self[:] + other[:])
+        return Union(self[:] + [other])
 
     def __ior__(self, other):
         if isinstance(other, Union):
@@ -469,15 +479,18 @@ class Union(Region, MutableSequence):
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        GeometryRevision.bump()
 
     def __delitem__(self, key):
         del self._nodes[key]
+        GeometryRevision.bump()
 
     def __len__(self):
         return len(self._nodes)
 
     def insert(self, index, value):
         self._nodes.insert(index, value)
+        GeometryRevision.bump()
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -539,7 +552,10 @@ class Complement(Region):
     """
 
     def __init__(self, node):
-        self.node = node
+        # The property setter is bypassed since a new region cannot yet be
+        # part of any geometry whose derived data has been cached
+        check_type('node', node, Region)
+        self._node = node
 
     def __contains__(self, point):
         """Check whether a point is contained in the region.
@@ -568,6 +584,7 @@ class Complement(Region):
     def node(self, node):
         check_type('node', node, Region)
         self._node = node
+        GeometryRevision.bump()
 
     @property
     def bounding_box(self):
@@ -183,10 +183,11 @@ class Summary:
         return cell_fills
 
     def _read_universes(self):
+        str_memo = {}
         for group in self._f['geometry/universes'].values():
             geom_type = group.get('geom_type')
             if geom_type and geom_type[()].decode() == 'dagmc':
-                universe = openmc.DAGMCUniverse.from_hdf5(group)
+                universe = openmc.DAGMCUniverse.from_hdf5(group, str_memo)
             else:
                 universe = openmc.Universe.from_hdf5(group, self._fast_cells)
             self._fast_universes[universe.id] = universe
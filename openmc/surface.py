@@ -10,7 +10,7 @@ from warnings import warn, catch_warnings, simplefilter
 import numpy as np
 
 from .checkvalue import check_type, check_value, check_length
-from .mixin import IDManagerMixin, IDWarning
+from .mixin import GeometryRevision, IDManagerMixin, IDWarning
 from .region import Region, Intersection, Union
 
 
@@ -53,7 +53,13 @@ class SurfaceCoefficient:
         if isinstance(self.value, Real):
             raise AttributeError('This coefficient is read-only')
         check_type(f'{self.value} coefficient', value, Real)
-        instance._coefficients[self.value] = value
+        coefficients = instance._coefficients
+        # Coefficients are set for the first time while a surface is being
+        # constructed, before it can be part of any geometry whose derived
+        # data has been cached
+        if self.value in coefficients:
+            GeometryRevision.bump()
+        coefficients[self.value] = value
 
 
 def _future_kwargs_warning_helper(cls, *args, **kwargs):
@@ -2440,8 +2446,12 @@ class Halfspace(Region):
     """
 
     def __init__(self, surface, side):
-        self.surface = surface
-        self.side = side
+        # The property setters are bypassed since a new half-space cannot yet
+        # be part of any geometry whose derived data has been cached
+        check_type('surface', surface, Surface)
+        check_value('side', side, ('+', '-'))
+        self._surface = surface
+        self._side = side
 
     def __and__(self, other):
         if isinstance(other, Intersection):
@@ -2484,6 +2494,7 @@ class Halfspace(Region):
     def surface(self, surface):
         check_type('surface', surface, Surface)
         self._surface = surface
+        GeometryRevision.bump()
 
     @property
     def side(self):
@@ -2493,6 +2504,7 @@ class Halfspace(Region):
     def side(self, side):
         check_value('side', side, ('+', '-'))
         self._side = side
+        GeometryRevision.bump()
 
     @property
     def bounding_box(self):
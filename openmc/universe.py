@@ -1,24 +1,69 @@
+import os
+import sys
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from collections.abc import Iterable
-from copy import deepcopy
+from functools import lru_cache
+from itertools import chain
 from numbers import Integral, Real
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from xml.etree import ElementTree as ET
 
-import h5py
 import numpy as np
 
 import openmc
 import openmc.checkvalue as cv
 
+from ._bvh import BoundingVolumeHierarchy, points_in_box
 from ._xml import get_text
 from .checkvalue import check_type, check_value
-from .mixin import IDManagerMixin
-from .plots import _SVG_COLORS
+from .mixin import GeometryRevision, IDManagerMixin
 from .surface import _BOUNDARY_TYPES
 
+# Number of rows of a dataset to read at once when reducing over it
+_BLOCK_ROWS = 65536
+
+# Minimum number of cells in a universe for Universe.find to screen cells with
+# a bounding volume hierarchy rather than checking each cell in turn
+_BVH_MIN_CELLS = 16
+
+
+@lru_cache(maxsize=65536)
+def _format_index(index):
+    """Format a lattice index as it appears in cell and material paths"""
+    return ",".join(str(x) for x in index)
+
+
+@lru_cache(maxsize=None)
+def _import_matplotlib():
+    """Import the matplotlib modules used for plotting universes"""
+    import matplotlib.image as mpimg
+    import matplotlib.pyplot as plt
+    return mpimg, plt
+
+
+def _intern(value, memo):
+    """Return an interned string for a raw bytes or str value, reusing the
+    result for values that have already been seen
+
+    Parameters
+    ----------
+    value : bytes or str
+        Raw value as read from a file
+    memo : dict
+        Dictionary mapping raw values to interned strings
+
+    Returns
+    -------
+    str
+        Interned string
+
+    """
+    s = memo.get(value)
+    if s is None:
+        s = sys.intern(value.decode() if isinstance(value, bytes) else value)
+        memo[value] = s
+    return s
+
 
 class UniverseBase(ABC, IDManagerMixin):
     """A collection of cells that can be repeated.
@@ -39,11 +84,19 @@ class UniverseBase(ABC, IDManagerMixin):
         self.id = universe_id
         self.name = name
         self._volume = None
+        self._init_state()
+
+    def _init_state(self):
+        """Initialize the cells, atom counts, and cached data of the universe"""
         self._atoms = {}
+        self._bbox_cache = None
+        self._bvh = None
+        self._cells_cache = None
+        self._materials_cache = None
 
         # Keys   - Cell IDs
         # Values - Cells
-        self._cells = OrderedDict()
+        self._cells = {}
 
     def __repr__(self):
         string = 'Universe\n'
@@ -96,13 +149,13 @@ class UniverseBase(ABC, IDManagerMixin):
 
         Returns
         -------
-        universes : collections.OrderedDict
+        universes : dict
             Dictionary whose keys are universe IDs and values are
             :class:`Universe` instances
 
         """
         # Append all Universes within each Cell to the dictionary
-        universes = OrderedDict()
+        universes = {}
         for cell in self.get_all_cells().values():
             universes.update(cell.get_all_universes())
 
@@ -165,7 +218,7 @@ class UniverseBase(ABC, IDManagerMixin):
             clone = self._partial_deepcopy()
 
             # Clone all cells for the universe clone
-            clone._cells = OrderedDict()
+            clone._cells = {}
             for cell in self._cells.values():
                 clone.add_cell(cell.clone(clone_materials, clone_regions,
                      memo))
@@ -195,7 +248,7 @@ class Universe(UniverseBase):
         Unique identifier of the universe
     name : str
         Name of the universe
-    cells : collections.OrderedDict
+    cells : dict
         Dictionary whose keys are cell IDs and values are :class:`Cell`
         instances
     volume : float
@@ -211,8 +264,10 @@ class Universe(UniverseBase):
     def __init__(self, universe_id=None, name='', cells=None):
         super().__init__(universe_id, name)
 
+        # The geometry revision is not bumped since a new universe cannot yet
+        # be part of any geometry whose derived data has been cached
         if cells is not None:
-            self.add_cells(cells)
+            self._add_cells(cells)
 
     def __repr__(self):
         string = super().__repr__()
@@ -226,13 +281,24 @@ class Universe(UniverseBase):
 
     @property
     def bounding_box(self):
-        regions = [c.region for c in self.cells.values()
-                   if c.region is not None]
-        if regions:
-            return openmc.Union(regions).bounding_box
-        else:
-            # Infinite bounding box
-            return openmc.Intersection([]).bounding_box
+        # The cached box is only valid if no cell, region, or surface has been
+        # modified since it was computed
+        cache = self._bbox_cache
+        if cache is None or cache[0] != GeometryRevision.value:
+            regions = [c.region for c in self.cells.values()
+                       if c.region is not None]
+            if regions:
+                # Reduce the boxes of all regions at once rather than building
+                # a Union of them, with shape (N, 2, 3)
+                boxes = np.array([r.bounding_box for r in regions], dtype=float)
+                bbox = (boxes[:, 0].min(axis=0), boxes[:, 1].max(axis=0))
+            else:
+                # Infinite bounding box
+                bbox = (np.full(3, -np.inf), np.full(3, np.inf))
+            cache = self._bbox_cache = (GeometryRevision.value, bbox)
+
+        lower_left, upper_right = cache[1]
+        return lower_left.copy(), upper_right.copy()
 
     @classmethod
     def from_hdf5(cls, group, cells):
@@ -251,15 +317,16 @@ class Universe(UniverseBase):
             Universe instance
 
         """
-        universe_id = int(group.name.split('/')[-1].lstrip('universe '))
+        universe_id = int(group.name.rpartition('/universe ')[2])
         cell_ids = group['cells'][()]
 
         # Create this Universe
         universe = cls(universe_id)
 
-        # Add each Cell to the Universe
-        for cell_id in cell_ids:
-            universe.add_cell(cells[cell_id])
+        # Add the Cells to the Universe. They are already Cell instances keyed
+        # by their IDs, so the checks in add_cell are not needed.
+        universe._cells = {cell_id: cells[cell_id]
+                           for cell_id in cell_ids.tolist()}
 
         return universe
 
@@ -279,20 +346,101 @@ class Universe(UniverseBase):
 
         """
         p = np.asarray(point)
-        for cell in self._cells.values():
+        if len(self._cells) < _BVH_MIN_CELLS:
+            cells = self._cells.values()
+        else:
+            # Only check cells whose bounding box contains the point
+            bvh, cells = self._cell_bvh()
+            cells = [cells[i] for i in bvh.query(p)]
+        for cell in cells:
             if p in cell:
                 if cell.fill_type in ('material', 'distribmat', 'void'):
                     return [self, cell]
                 elif cell.fill_type == 'universe':
-                    if cell.translation is not None:
-                        p -= cell.translation
-                    if cell.rotation is not None:
-                        p[:] = cell.rotation_matrix.dot(p)
+                    p = cell._apply_inverse_transform(p)
                     return [self, cell] + cell.fill.find(p)
                 else:
                     return [self, cell] + cell.fill.find(p)
         return []
 
+    def find_batch(self, points):
+        """Find cells/universes/lattices which contain each of several points
+
+        Points are screened against the bounding boxes of all cells at once
+        before exact region containment is checked, and points falling in
+        universe-filled cells are transformed and passed down as a batch.
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        list of list
+            For each point, the sequence of universes, cells, and lattices
+            which are traversed to find the point as returned by
+            :meth:`Universe.find`
+
+        """
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        paths = [[] for _ in range(len(points))]
+        bvh, cells = self._cell_bvh()
+
+        # Indices of points that have not yet been located
+        remaining = np.arange(len(points))
+
+        for i, cell in enumerate(cells):
+            if remaining.size == 0:
+                break
+
+            # Screen points by bounding box, then check region containment
+            p = points[remaining]
+            in_box = np.all((p >= bvh.box_lower_left[i]) &
+                            (p <= bvh.box_upper_right[i]), axis=1)
+            idx = remaining[in_box]
+            inside = np.fromiter((points[j] in cell for j in idx),
+                                 dtype=bool, count=idx.size)
+            idx = idx[inside]
+            if idx.size == 0:
+                continue
+            remaining = np.setdiff1d(remaining, idx, assume_unique=True)
+
+            if cell.fill_type in ('material', 'distribmat', 'void'):
+                for j in idx:
+                    paths[j] = [self, cell]
+            elif cell.fill_type == 'universe':
+                p = cell._apply_inverse_transform(points[idx])
+                for j, path in zip(idx, cell.fill.find_batch(p)):
+                    paths[j] = [self, cell] + path
+            else:
+                for j in idx:
+                    paths[j] = [self, cell] + cell.fill.find(points[j])
+
+        return paths
+
+    def _cell_bvh(self):
+        """Return a bounding volume hierarchy over the bounding boxes of the
+        cells in the universe along with the corresponding list of cells. The
+        hierarchy is rebuilt whenever the geometry revision has changed, i.e.,
+        after any cell, region, or surface has been modified."""
+        cache = self._bvh
+        if cache is None or cache[0] != GeometryRevision.value:
+            cells = list(self._cells.values())
+            lower_left = np.empty((len(cells), 3))
+            upper_right = np.empty((len(cells), 3))
+            for i, cell in enumerate(cells):
+                lower_left[i], upper_right[i] = cell.bounding_box
+            bvh = BoundingVolumeHierarchy(lower_left, upper_right)
+            cache = self._bvh = (GeometryRevision.value, bvh, cells)
+        return cache[1], cache[2]
+
+    def _invalidate_cache(self):
+        """Discard data derived from the cells of the universe"""
+        self._bbox_cache = None
+        self._bvh = None
+        GeometryRevision.bump()
+
     def plot(self, origin=(0., 0., 0.), width=(1., 1.), pixels=(200, 200),
              basis='xy', color_by='cell', colors=None, seed=None,
              openmc_exec='openmc', axes=None, **kwargs):
@@ -338,8 +486,7 @@ class Universe(UniverseBase):
             Resulting image
 
         """
-        import matplotlib.image as mpimg
-        import matplotlib.pyplot as plt
+        mpimg, plt = _import_matplotlib()
 
         # Determine extents of plot
         if basis == 'xy':
@@ -364,10 +511,9 @@ class Universe(UniverseBase):
 
             # Determine whether any materials contains macroscopic data and if
             # so, set energy mode accordingly
-            for mat in self.get_all_materials().values():
-                if mat._macroscopic is not None:
-                    model.settings.energy_mode = 'multi-group'
-                    break
+            if any(mat._macroscopic is not None
+                   for mat in self.get_all_materials().values()):
+                model.settings.energy_mode = 'multi-group'
 
             # Create plot object matching passed arguments
             plot = openmc.Plot()
@@ -413,6 +559,12 @@ class Universe(UniverseBase):
             Cell to add
 
         """
+        if self._add_cell(cell):
+            self._invalidate_cache()
+
+    def _add_cell(self, cell):
+        """Add a cell to the universe without invalidating cached data and
+        return whether it was not already present"""
 
         if not isinstance(cell, openmc.Cell):
             msg = f'Unable to add a Cell to Universe ID="{self._id}" since ' \
@@ -421,8 +573,10 @@ class Universe(UniverseBase):
 
         cell_id = cell.id
 
-        if cell_id not in self._cells:
-            self._cells[cell_id] = cell
+        if cell_id in self._cells:
+            return False
+        self._cells[cell_id] = cell
+        return True
 
     def add_cells(self, cells):
         """Add multiple cells to the universe.
@@ -433,6 +587,14 @@ class Universe(UniverseBase):
             Cells to add
 
         """
+        try:
+            self._add_cells(cells)
+        finally:
+            self._invalidate_cache()
+
+    def _add_cells(self, cells):
+        """Add multiple cells to the universe without invalidating cached
+        data"""
 
         if not isinstance(cells, Iterable):
             msg = f'Unable to add Cells to Universe ID="{self._id}" since ' \
@@ -440,7 +602,7 @@ class Universe(UniverseBase):
             raise TypeError(msg)
 
         for cell in cells:
-            self.add_cell(cell)
+            self._add_cell(cell)
 
     def remove_cell(self, cell):
         """Remove a cell from the universe.
@@ -458,12 +620,14 @@ class Universe(UniverseBase):
             raise TypeError(msg)
 
         # If the Cell is in the Universe's list of Cells, delete it
-        self._cells.pop(cell.id, None)
+        if self._cells.pop(cell.id, None) is not None:
+            self._invalidate_cache()
 
     def clear_cells(self):
         """Remove all cells from the universe."""
 
         self._cells.clear()
+        self._invalidate_cache()
 
     def get_nuclides(self):
         """Returns all nuclides in the universe
@@ -475,27 +639,24 @@ class Universe(UniverseBase):
 
         """
 
-        nuclides = []
-
-        # Append all Nuclides in each Cell in the Universe to the dictionary
-        for cell in self.cells.values():
-            for nuclide in cell.get_nuclides():
-                if nuclide not in nuclides:
-                    nuclides.append(nuclide)
+        # Collect the nuclides in each Cell in the Universe, using a dictionary
+        # to remove duplicates while preserving order
+        nuclides = dict.fromkeys(chain.from_iterable(
+            cell.get_nuclides() for cell in self.cells.values()))
 
-        return nuclides
+        return list(nuclides)
 
     def get_nuclide_densities(self):
         """Return all nuclides contained in the universe
 
         Returns
         -------
-        nuclides : collections.OrderedDict
+        nuclides : dict
             Dictionary whose keys are nuclide names and values are 2-tuples of
             (nuclide, density)
 
         """
-        nuclides = OrderedDict()
+        nuclides = {}
 
         if self._atoms:
             volume = self.volume
@@ -517,49 +678,102 @@ class Universe(UniverseBase):
 
         Returns
         -------
-        cells : collections.OrderedDict
+        cells : dict
             Dictionary whose keys are cell IDs and values are :class:`Cell`
             instances
 
         """
 
-        cells = OrderedDict()
+        cells = {}
 
         if memo and self in memo:
             return cells
 
-        if memo is not None:
-            memo.add(self)
+        # A complete traversal, i.e., one not starting from a partially filled
+        # memo, can be reused until the structure of the geometry changes
+        complete = not memo
+        if complete:
+            cached = self._get_cached('_cells_cache', memo)
+            if cached is not None:
+                return cached
+            if memo is None:
+                memo = set()
+        revision = GeometryRevision.value
+
+        self._collect_cells(cells, memo)
+
+        if complete:
+            self._set_cached('_cells_cache', revision, cells, memo)
+        return cells
+
+    def _collect_cells(self, cells, memo):
+        """Add all cells contained within the universe to `cells`, skipping
+        objects that have already been visited"""
+        if self in memo:
+            return
+        memo.add(self)
 
         # Add this Universe's cells to the dictionary
         cells.update(self._cells)
 
-        # Append all Cells in each Cell in the Universe to the dictionary
+        # Add all Cells in each Cell in the Universe to the dictionary
         for cell in self._cells.values():
-            cells.update(cell.get_all_cells(memo))
-
-        return cells
+            cell._collect_cells(cells, memo)
 
     def get_all_materials(self, memo=None):
         """Return all materials that are contained within the universe
 
         Returns
         -------
-        materials : collections.OrderedDict
+        materials : dict
             Dictionary whose keys are material IDs and values are
             :class:`Material` instances
 
         """
 
-        materials = OrderedDict()
+        complete = not memo
+        if complete:
+            cached = self._get_cached('_materials_cache', memo)
+            if cached is not None:
+                return cached
+            if memo is None:
+                memo = set()
+        revision = GeometryRevision.value
 
-        # Append all Cells in each Cell in the Universe to the dictionary
+        materials = {}
+
+        # Add the materials of all cells contained within the universe
         cells = self.get_all_cells(memo)
         for cell in cells.values():
-            materials.update(cell.get_all_materials(memo))
+            cell._collect_materials(materials, memo)
 
+        # Distributed material fills can be modified in place, so results
+        # involving them are never cached
+        if complete and not any(c.fill_type == 'distribmat'
+                                for c in cells.values()):
+            self._set_cached('_materials_cache', revision, materials, memo)
         return materials
 
+    def _get_cached(self, attr, memo):
+        """Return a copy of a cached traversal result if it is still valid,
+        adding the objects visited by the traversal to `memo`."""
+        cache = getattr(self, attr)
+        if cache is None or cache[0] != GeometryRevision.value:
+            return None
+        if memo is not None:
+            memo.update(cache[2])
+        # Keys are regenerated in case IDs have changed in the meantime
+        return {obj.id: obj for obj in cache[1]}
+
+    def _set_cached(self, attr, revision, result, memo):
+        """Cache the result of a complete traversal. The universes of a
+        lattice are held in an array that can be modified element by element
+        without incrementing the geometry revision, so traversals passing
+        through a lattice are not cached."""
+        if any(isinstance(obj, openmc.Lattice) for obj in memo):
+            return
+        setattr(self, attr, (revision, list(result.values()), frozenset(memo)))
+
     def create_xml_subelement(self, xml_element, memo=None):
         # Iterate over all Cells
         for cell in self._cells.values():
@@ -582,27 +796,35 @@ class Universe(UniverseBase):
         """Count the number of instances for each cell in the universe, and
         record the count in the :attr:`Cell.num_instances` properties."""
 
-        univ_path = path + f'u{self.id}'
+        # Path strings are only built when they are going to be stored
+        if not instances_only:
+            univ_path = path + f'u{self.id}'
 
         for cell in self.cells.values():
-            cell_path = f'{univ_path}->c{cell.id}'
+            cell_path = None if instances_only else f'{univ_path}->c{cell.id}'
             fill = cell._fill
             fill_type = cell.fill_type
 
             # If universe-filled, recursively count cells in filling universe
             if fill_type == 'universe':
-                fill._determine_paths(cell_path + '->', instances_only)
+                fill._determine_paths(
+                    None if instances_only else cell_path + '->',
+                    instances_only)
 
             # If lattice-filled, recursively call for all universes in lattice
             elif fill_type == 'lattice':
                 latt = fill
 
                 # Count instances in each universe in the lattice
-                for index in latt._natural_indices:
-                    latt_path = '{}->l{}({})->'.format(
-                        cell_path, latt.id, ",".join(str(x) for x in index))
-                    univ = latt.get_universe(index)
-                    univ._determine_paths(latt_path, instances_only)
+                if instances_only:
+                    for index in latt._natural_indices:
+                        latt.get_universe(index)._determine_paths(None, True)
+                else:
+                    prefix = f'{cell_path}->l{latt.id}('
+                    for index in latt._natural_indices:
+                        latt_path = prefix + _format_index(index) + ')->'
+                        univ = latt.get_universe(index)
+                        univ._determine_paths(latt_path, instances_only)
 
             else:
                 if fill_type == 'material':
@@ -632,6 +854,71 @@ class Universe(UniverseBase):
         return clone
 
 
+def _dataset_bounds(dataset):
+    """Compute the minimum and maximum of each column of a two-dimensional
+    dataset, reading it in blocks of rows rather than all at once
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        Dataset with shape (N, M)
+
+    Returns
+    -------
+    2-tuple of numpy.ndarray
+        Minimum and maximum of each column
+
+    """
+    lower = np.full(dataset.shape[1], np.inf)
+    upper = np.full(dataset.shape[1], -np.inf)
+
+    # Read whole chunks at a time if the dataset is chunked
+    step = _BLOCK_ROWS
+    if dataset.chunks is not None:
+        step = dataset.chunks[0] * max(_BLOCK_ROWS // dataset.chunks[0], 1)
+
+    for start in range(0, dataset.shape[0], step):
+        block = dataset[start:start + step]
+        np.minimum(lower, block.min(axis=0), out=lower)
+        np.maximum(upper, block.max(axis=0), out=upper)
+    return lower, upper
+
+
+def _bool_attr(value):
+    """Convert a scalar HDF5 attribute value to bool without going through
+    NumPy's truth value logic"""
+    return bool(value.item()) if hasattr(value, 'item') else bool(value)
+
+
+def _xml_bool(elem, name):
+    """Interpret an attribute or subelement of an XML element as a boolean the
+    same way as the XML reader of the OpenMC executable (pugixml), for which
+    values starting with 1, t, T, y, or Y are true and all others are false"""
+    a = elem.attrib
+    value = a[name] if name in a else get_text(elem, name)
+    return bool(value) and value[0] in '1tTyY'
+
+
+def _read_tag_strings(dataset):
+    """Read a dataset of fixed-width DAGMC tags as null-stripped byte strings
+
+    Parameters
+    ----------
+    dataset : h5py.Dataset
+        Dataset of tag values, one fixed-width opaque value per row
+
+    Returns
+    -------
+    numpy.ndarray
+        One-dimensional array of byte strings
+
+    """
+    data = np.ascontiguousarray(dataset[()])
+    width = data.dtype.itemsize * int(np.prod(data.shape[1:]))
+    data = data.view(np.uint8).reshape(len(data), width)
+    return data.view(f'S{width}').ravel()
+
+
 class DAGMCUniverse(UniverseBase):
     """A reference to a DAGMC file to be used in the model.
 
@@ -692,6 +979,11 @@ class DAGMCUniverse(UniverseBase):
 
     """
 
+    # Attributes shared by a universe and the clones made of it. The file
+    # metadata is never modified in place, so it can be shared as well.
+    _CLONE_FIELDS = ('_name', '_filename', '_volume', '_auto_geom_ids',
+                     '_auto_mat_ids', '_metadata')
+
     def __init__(self,
                  filename,
                  universe_id=None,
@@ -712,11 +1004,26 @@ class DAGMCUniverse(UniverseBase):
 
     @property
     def bounding_box(self):
-        with h5py.File(self.filename) as dagmc_file:
-            coords = dagmc_file['tstt']['nodes']['coordinates'][()]
-            lower_left_corner = coords.min(axis=0)
-            upper_right_corner = coords.max(axis=0)
-            return (lower_left_corner, upper_right_corner)
+        lower_left, upper_right = self._load_metadata()['bounding_box']
+        return lower_left.copy(), upper_right.copy()
+
+    def contains_batch(self, points):
+        """Determine which points lie within the bounding box of the DAGMC
+        geometry, including its faces
+
+        Parameters
+        ----------
+        points : Iterable of 3-tuple of float
+            Cartesian coordinates of the points with shape (N, 3)
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array indicating whether each point is in the bounding box
+
+        """
+        lower_left, upper_right = self._load_metadata()['bounding_box']
+        return points_in_box(points, lower_left, upper_right)
 
     @property
     def filename(self):
@@ -726,6 +1033,7 @@ class DAGMCUniverse(UniverseBase):
     def filename(self, val):
         cv.check_type('DAGMC filename', val, (Path, str))
         self._filename = val
+        self._metadata = None
 
     @property
     def auto_geom_ids(self):
@@ -742,18 +1050,7 @@ class DAGMCUniverse(UniverseBase):
 
     @property
     def material_names(self):
-        dagmc_file_contents = h5py.File(self.filename)
-        material_tags_hex=dagmc_file_contents['/tstt/tags/NAME'].get('values')
-        material_tags_ascii=[]
-        for tag in material_tags_hex:
-            candidate_tag = tag.tobytes().decode().replace('\x00', '')
-            # tags might be for temperature or reflective surfaces
-            if candidate_tag.startswith('mat:'):
-                # removes first 4 characters as openmc.Material name should be
-                # set without the 'mat:' part of the tag
-                material_tags_ascii.append(candidate_tag[4:])
-
-        return sorted(set(material_tags_ascii))
+        return list(self._load_metadata()['material_names'])
 
     @auto_mat_ids.setter
     def auto_mat_ids(self, val):
@@ -761,12 +1058,57 @@ class DAGMCUniverse(UniverseBase):
         self._auto_mat_ids = val
 
     def get_all_cells(self, memo=None):
-        return OrderedDict()
+        return {}
 
     def get_all_materials(self, memo=None):
-        return OrderedDict()
+        return {}
+
+    def _collect_cells(self, cells, memo):
+        pass
+
+    def _load_metadata(self):
+        """Read the bounding box, number of cells and surfaces, and material
+        names from the DAGMC file. The file is only read again if it has been
+        modified since the last time it was read.
 
-    def _n_geom_elements(self, geom_type):
+        Returns
+        -------
+        dict
+            Metadata of the DAGMC file
+
+        """
+        key = (self.filename, os.stat(self.filename).st_mtime_ns)
+        if self._metadata is not None and self._metadata[0] == key:
+            return self._metadata[1]
+
+        import h5py
+        with h5py.File(self.filename) as dagmc_file:
+            coords = dagmc_file['tstt/nodes/coordinates']
+            bbox = _dataset_bounds(coords)
+
+            tags = dagmc_file['tstt/tags']
+            categories = _read_tag_strings(tags['CATEGORY/values']) \
+                if 'CATEGORY' in tags else np.array([], dtype='S1')
+            names = _read_tag_strings(tags['NAME/values']) \
+                if 'NAME' in tags else np.array([], dtype='S1')
+
+        # tags might be for temperature or reflective surfaces
+        material_tags = np.unique(names[np.char.startswith(names, b'mat:')])
+
+        metadata = {
+            'bounding_box': bbox,
+            'n_cells': self._n_geom_elements('volume', categories, names),
+            'n_surfaces': self._n_geom_elements('surface', categories, names),
+            # removes first 4 characters as openmc.Material name should be
+            # set without the 'mat:' part of the tag
+            'material_names': sorted({tag[4:].decode().replace('\x00', '')
+                                      for tag in material_tags}),
+        }
+        self._metadata = (key, metadata)
+        return metadata
+
+    @staticmethod
+    def _n_geom_elements(geom_type, categories, names):
         """
         Helper function for retrieving the number geometric entities in a DAGMC
         file
@@ -776,6 +1118,10 @@ class DAGMCUniverse(UniverseBase):
         geom_type : str
             The type of geometric entity to count. One of {'Volume', 'Surface'}. Returns
             the runtime number of voumes in the DAGMC model (includes implicit complement).
+        categories : numpy.ndarray
+            Values of the CATEGORY tag in the DAGMC file as byte strings
+        names : numpy.ndarray
+            Values of the NAME tag in the DAGMC file as byte strings
 
         Returns
         -------
@@ -784,31 +1130,23 @@ class DAGMCUniverse(UniverseBase):
         """
         cv.check_value('geometry type', geom_type, ('volume', 'surface'))
 
-        def decode_str_tag(tag_val):
-            return tag_val.tobytes().decode().replace('\x00', '')
-
-        dagmc_filepath = Path(self.filename).resolve()
-        with h5py.File(dagmc_filepath) as dagmc_file:
-            category_data = dagmc_file['tstt/tags/CATEGORY/values']
-            category_strs = map(decode_str_tag, category_data)
-            n = sum([v == geom_type.capitalize() for v in category_strs])
-
-            # check for presence of an implicit complement in the file and
-            # increment the number of cells if it doesn't exist
-            if geom_type == 'volume':
-                name_data = dagmc_file['tstt/tags/NAME/values']
-                name_strs = map(decode_str_tag, name_data)
-                if not sum(['impl_complement' in n for n in name_strs]):
-                    n += 1
+        category = geom_type.capitalize().encode()
+        n = int(np.count_nonzero(np.char.equal(categories, category)))
+
+        # check for presence of an implicit complement in the file and
+        # increment the number of cells if it doesn't exist
+        if geom_type == 'volume':
+            if not np.any(np.char.find(names, b'impl_complement') >= 0):
+                n += 1
         return n
 
     @property
     def n_cells(self):
-        return self._n_geom_elements('volume')
+        return self._load_metadata()['n_cells']
 
     @property
     def n_surfaces(self):
-        return self._n_geom_elements('surface')
+        return self._load_metadata()['n_surfaces']
 
     def create_xml_subelement(self, xml_element, memo=None):
         if memo and self in memo:
@@ -817,6 +1155,8 @@ class DAGMCUniverse(UniverseBase):
         if memo is not None:
             memo.add(self)
 
+        from xml.etree import ElementTree as ET
+
         # Set xml element values
         dagmc_element = ET.Element('dagmc_universe')
         dagmc_element.set('id', str(self.id))
@@ -861,6 +1201,8 @@ class DAGMCUniverse(UniverseBase):
         check_type('bounded type', bounded_type, str)
         check_value('bounded type', bounded_type, ('box', 'sphere'))
 
+        # The bounding box is cached with the file metadata, so only the
+        # surfaces are created anew on each call
         bbox = self.bounding_box
 
         if bounded_type == 'sphere':
@@ -879,18 +1221,21 @@ class DAGMCUniverse(UniverseBase):
 
         if bounded_type == 'box':
             # defines plane surfaces for all six faces of the bounding box
-            lower_x = openmc.XPlane(bbox[0][0], surface_id=starting_id)
-            upper_x = openmc.XPlane(bbox[1][0], surface_id=starting_id+1)
-            lower_y = openmc.YPlane(bbox[0][1], surface_id=starting_id+2)
-            upper_y = openmc.YPlane(bbox[1][1], surface_id=starting_id+3)
-            lower_z = openmc.ZPlane(bbox[0][2], surface_id=starting_id+4)
-            upper_z = openmc.ZPlane(bbox[1][2], surface_id=starting_id+5)
+            lower_x = openmc.XPlane(bbox[0][0], surface_id=starting_id,
+                                    boundary_type=boundary_type)
+            upper_x = openmc.XPlane(bbox[1][0], surface_id=starting_id+1,
+                                    boundary_type=boundary_type)
+            lower_y = openmc.YPlane(bbox[0][1], surface_id=starting_id+2,
+                                    boundary_type=boundary_type)
+            upper_y = openmc.YPlane(bbox[1][1], surface_id=starting_id+3,
+                                    boundary_type=boundary_type)
+            lower_z = openmc.ZPlane(bbox[0][2], surface_id=starting_id+4,
+                                    boundary_type=boundary_type)
+            upper_z = openmc.ZPlane(bbox[1][2], surface_id=starting_id+5,
+                                    boundary_type=boundary_type)
 
             region = +lower_x & -upper_x & +lower_y & -upper_y & +lower_z & -upper_z
 
-            for surface in region.get_surfaces().values():
-                surface.boundary_type = boundary_type
-
             return region
 
     def bounded_universe(self, bounding_cell_id=10000, **kwargs):
@@ -914,13 +1259,17 @@ class DAGMCUniverse(UniverseBase):
         return openmc.Universe(cells=[bounding_cell])
 
     @classmethod
-    def from_hdf5(cls, group):
+    def from_hdf5(cls, group, str_memo=None):
         """Create DAGMC universe from HDF5 group
 
         Parameters
         ----------
         group : h5py.Group
             Group in HDF5 file
+        str_memo : dict, optional
+            Dictionary of previously decoded strings. Passing the same
+            dictionary when reading many universes lets them share filename
+            and name strings.
 
         Returns
         -------
@@ -928,25 +1277,49 @@ class DAGMCUniverse(UniverseBase):
             DAGMCUniverse instance
 
         """
-        id = int(group.name.split('/')[-1].lstrip('universe '))
-        fname = group['filename'][()].decode()
-        name = group['name'][()].decode() if 'name' in group else None
+        if str_memo is None:
+            str_memo = {}
+        id = int(group.name.rpartition('/universe ')[2])
 
-        out = cls(fname, universe_id=id, name=name)
+        # Read all attributes and the string datasets up front
+        attrs = dict(group.attrs)
+        items = {k: group[k][()] for k in ('filename', 'name') if k in group}
 
-        out.auto_geom_ids = bool(group.attrs['auto_geom_ids'])
-        out.auto_mat_ids = bool(group.attrs['auto_mat_ids'])
+        fname = _intern(items['filename'], str_memo)
+        name = _intern(items['name'], str_memo) if 'name' in items else None
 
+        return cls._construct(id, fname, name,
+                              _bool_attr(attrs['auto_geom_ids']),
+                              _bool_attr(attrs['auto_mat_ids']))
+
+    @classmethod
+    def _construct(cls, universe_id, filename, name, auto_geom_ids,
+                   auto_mat_ids):
+        """Create a DAGMC universe from values read from a file, bypassing
+        __init__ and the validation done by the property setters"""
+        out = cls.__new__(cls)
+        out.id = universe_id
+        out._name = name if name is not None else ''
+        out._volume = None
+        out._init_state()
+        out._filename = filename
+        out._metadata = None
+        out._auto_geom_ids = auto_geom_ids
+        out._auto_mat_ids = auto_mat_ids
         return out
 
     @classmethod
-    def from_xml_element(cls, elem):
+    def from_xml_element(cls, elem, str_memo=None):
         """Generate DAGMC universe from XML element
 
         Parameters
         ----------
         elem : xml.etree.ElementTree.Element
             `<dagmc_universe>` element
+        str_memo : dict, optional
+            Dictionary of previously seen strings. Passing the same dictionary
+            when reading many universes lets them share filename and name
+            strings.
 
         Returns
         -------
@@ -954,17 +1327,22 @@ class DAGMCUniverse(UniverseBase):
             DAGMCUniverse instance
 
         """
-        id = int(get_text(elem, 'id'))
-        fname = get_text(elem, 'filename')
+        if str_memo is None:
+            str_memo = {}
+        # Values are normally attributes, so the attribute dictionary is read
+        # directly and get_text is only used for values given as subelements
+        a = elem.attrib
+        id = int(a['id'] if 'id' in a else get_text(elem, 'id'))
+        fname = a['filename'] if 'filename' in a else get_text(elem, 'filename')
 
-        out = cls(fname, universe_id=id)
+        out = cls(_intern(fname, str_memo), universe_id=id)
 
-        name = get_text(elem, 'name')
+        name = a['name'] if 'name' in a else get_text(elem, 'name')
         if name is not None:
-            out.name = name
+            out.name = _intern(name, str_memo)
 
-        out.auto_geom_ids = bool(elem.get('auto_geom_ids'))
-        out.auto_mat_ids = bool(elem.get('auto_mat_ids'))
+        out.auto_geom_ids = _xml_bool(elem, 'auto_geom_ids')
+        out.auto_mat_ids = _xml_bool(elem, 'auto_mat_ids')
 
         return out
 
@@ -973,8 +1351,10 @@ class DAGMCUniverse(UniverseBase):
         its cells, as they are copied within the clone function. This should
         only to be used within the openmc.UniverseBase.clone() context.
         """
-        clone = openmc.DAGMCUniverse(name=self.name, filename=self.filename)
-        clone.volume = self.volume
-        clone.auto_geom_ids = self.auto_geom_ids
-        clone.auto_mat_ids = self.auto_mat_ids
+        # The attributes have already been validated, so they are copied
+        # directly rather than through __init__ and the property setters
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update({k: self.__dict__[k] for k in self._CLONE_FIELDS})
+        clone.id = None
+        clone._init_state()
         return clone
\ No newline at end of file
@@ -1,3 +1,4 @@
+import h5py
 import openmc
 import pytest
 from pathlib import Path
@@ -41,6 +42,14 @@ def test_bounding_region(request):
     assert region.surface.type == "sphere"
     assert region.surface.boundary_type == "reflective"
 
+    # modifying a returned region does not affect subsequent calls
+    region = u.bounding_region()
+    region &= -openmc.Sphere(r=5.0)
+    region[0].surface.boundary_type = "reflective"
+    region = u.bounding_region()
+    assert len(region) == 6
+    assert region[0].surface.boundary_type == "vacuum"
+
 
 def test_bounded_universe(request):
     """Checks that the DAGMCUniverse.bounded_universe() returns a
@@ -72,6 +81,14 @@ def test_bounded_universe(request):
     assert surfaces[0][1].type == "sphere"
     assert surfaces[0][1].id == 43
 
+    # modifying a returned universe does not affect subsequent calls
+    bu = u.bounded_universe()
+    bu.cells[10000].region &= -openmc.Sphere(r=5.0)
+    bu.add_cell(openmc.Cell())
+    bu = u.bounded_universe()
+    assert len(bu.cells) == 1
+    assert len(bu.cells[10000].region) == 6
+
 
 def test_material_names(request):
     """Checks that the DAGMCUniverse.material_names() returns a list of the
@@ -80,3 +97,48 @@ def test_material_names(request):
     u = openmc.DAGMCUniverse(Path(request.fspath).parent / "dagmc.h5m")
 
     assert u.material_names == ['41', 'Graveyard', 'no-void fuel']
+
+
+def test_bounding_box_blocks(request, monkeypatch):
+    """Checks that the DAGMCUniverse.bounding_box is the same when the
+    coordinates are read in several blocks"""
+
+    monkeypatch.setattr(openmc.universe, '_BLOCK_ROWS', 1000)
+    u = openmc.DAGMCUniverse(Path(request.fspath).parent / "dagmc.h5m")
+
+    ll, ur = u.bounding_box
+    assert ll == pytest.approx((-25.0, -25.0, -25))
+    assert ur == pytest.approx((25.0, 25.0, 25))
+
+
+def test_metadata(request, tmp_path):
+    """Checks the number of cells and surfaces and that cached metadata is
+    refreshed when the filename changes"""
+
+    dagmc_file = Path(request.fspath).parent / "dagmc.h5m"
+    u = openmc.DAGMCUniverse(dagmc_file)
+    assert u.n_cells == 5
+    assert u.n_surfaces == 21
+
+    # Cached values must not be affected by modifying returned objects
+    u.material_names.clear()
+    assert u.material_names == ['41', 'Graveyard', 'no-void fuel']
+
+    # Point to a file with different contents
+    with h5py.File(dagmc_file) as src, h5py.File(tmp_path / 'copy.h5m', 'w') as dst:
+        src.copy('tstt', dst)
+        coords = dst['tstt/nodes/coordinates']
+        coords[0] = (-30., -30., -30.)
+    u.filename = tmp_path / 'copy.h5m'
+    ll, ur = u.bounding_box
+    assert ll == pytest.approx((-30.0, -30.0, -30))
+    assert ur == pytest.approx((25.0, 25.0, 25))
+
+
+def test_contains_batch(request):
+    """Checks that DAGMCUniverse.contains_batch() tests points against the
+    bounding box"""
+
+    u = openmc.DAGMCUniverse(Path(request.fspath).parent / "dagmc.h5m")
+    points = [(0., 0., 0.), (25., 25., 25.), (0., 0., 25.1), (-30., 0., 0.)]
+    assert u.contains_batch(points).tolist() == [True, True, False, False]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from openmc._bvh import BoundingVolumeHierarchy, _aabb_traverse
+
+
+@pytest.fixture(scope='module')
+def boxes():
+    rng = np.random.default_rng(1)
+    lower_left = rng.uniform(-10., 10., (50, 3))
+    upper_right = lower_left + rng.uniform(0., 5., (50, 3))
+    # Include boxes that are unbounded in some or all directions
+    lower_left[0] = -np.inf
+    upper_right[0] = np.inf
+    lower_left[1, 2] = -np.inf
+    upper_right[2, :2] = np.inf
+    return lower_left, upper_right
+
+
+def brute_force(boxes, p):
+    lower_left, upper_right = boxes
+    inside = np.all((p >= lower_left) & (p <= upper_right), axis=1)
+    return np.flatnonzero(inside).tolist()
+
+
+def test_query(boxes):
+    bvh = BoundingVolumeHierarchy(*boxes)
+    assert len(bvh) == 2*len(boxes[0]) - 1
+    rng = np.random.default_rng(2)
+    for p in rng.uniform(-15., 15., (200, 3)):
+        assert bvh.query(p) == brute_force(boxes, p)
+
+
+def test_traverse_kernel(boxes):
+    bvh = BoundingVolumeHierarchy(*boxes)
+    out = np.empty(len(boxes[0]), dtype=np.int32)
+    rng = np.random.default_rng(3)
+    for p in rng.uniform(-15., 15., (50, 3)):
+        n = _aabb_traverse(p, bvh.lower_left, bvh.upper_right, bvh.left,
+                           bvh.right, bvh.leaf_ids, out)
+        assert sorted(out[:n].tolist()) == brute_force(boxes, p)
+
+
+def test_compiled_kernels(boxes):
+    # The kernels are compiled with Numba when it is available
+    pytest.importorskip('numba')
+    from openmc import _bvh
+    assert _bvh._have_numba
+    assert hasattr(_bvh._aabb_traverse, 'py_func')
+    assert hasattr(_bvh._points_in_box, 'py_func')
+
+    bvh = BoundingVolumeHierarchy(*boxes)
+    out = np.empty(len(boxes[0]), dtype=np.int32)
+    rng = np.random.default_rng(5)
+    for p in rng.uniform(-15., 15., (50, 3)):
+        n = _bvh._aabb_traverse(p, bvh.lower_left, bvh.upper_right, bvh.left,
+                                bvh.right, bvh.leaf_ids, out)
+        assert sorted(out[:n].tolist()) == brute_force(boxes, p)
+        assert bvh.query(p) == brute_force(boxes, p)
+
+    points = rng.uniform(-15., 15., (100, 3))
+    lower_left, upper_right = boxes[0][1], boxes[1][1]
+    expected = np.all((points >= lower_left) & (points <= upper_right), axis=1)
+    out = np.empty(len(points), dtype=bool)
+    _bvh._points_in_box(points, lower_left, upper_right, out)
+    assert out.tolist() == expected.tolist()
+
+
+def test_empty():
+    bvh = BoundingVolumeHierarchy(np.empty((0, 3)), np.empty((0, 3)))
+    assert len(bvh) == 0
+    assert bvh.query(np.zeros(3)) == []
+
+
+def test_points_in_box():
+    from openmc._bvh import _points_in_box, points_in_box
+
+    rng = np.random.default_rng(4)
+    points = rng.uniform(-2., 2., (100, 3))
+    points[0] = np.nan
+    lower_left = np.array([-1., -1., -np.inf])
+    upper_right = np.array([1., 1., 1.])
+    expected = [bool(np.all((p >= lower_left) & (p <= upper_right)))
+                for p in points]
+    assert points_in_box(points, lower_left, upper_right).tolist() == expected
+
+    out = np.empty(len(points), dtype=bool)
+    _points_in_box(points, lower_left, upper_right, out)
+    assert out.tolist() == expected
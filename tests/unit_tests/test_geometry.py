@@ -306,6 +306,29 @@ def test_from_xml(run_in_tmpdir, mixed_lattice_model):
     assert ur == pytest.approx((6.0, 6.0, np.inf))
 
 
+def test_from_xml_periodic(run_in_tmpdir):
+    x0 = openmc.XPlane(-1.0, boundary_type='periodic')
+    x1 = openmc.XPlane(1.0, boundary_type='periodic')
+    x0.periodic_surface = x1
+    cell = openmc.Cell(region=+x0 & -x1)
+    openmc.Geometry([cell]).export_to_xml()
+
+    # Comments and surfaces following the cells must be handled
+    tree = ET.parse('geometry.xml')
+    root = tree.getroot()
+    root.insert(0, ET.Comment('comment'))
+    for elem in root.findall('surface'):
+        root.remove(elem)
+        root.append(elem)
+    tree.write('geometry.xml')
+
+    geom = openmc.Geometry.from_xml('geometry.xml', openmc.Materials())
+    surfaces = geom.get_all_surfaces()
+    assert surfaces[x0.id].periodic_surface is surfaces[x1.id]
+    cell, = geom.get_all_cells().values()
+    assert str(cell.region) == str(+x0 & -x1)
+
+
 def test_rotation_matrix():
     """Test ability to set a rotation matrix directly"""
     y = openmc.YPlane()
@@ -1,5 +1,6 @@
 import xml.etree.ElementTree as ET
 
+import h5py
 import numpy as np
 import openmc
 import pytest
@@ -48,6 +49,132 @@ def test_bounding_box():
     assert_unbounded(u)
 
 
+def test_bounding_box_cache():
+    cyl1 = openmc.ZCylinder(r=1.0)
+    cyl2 = openmc.ZCylinder(r=2.0)
+    c1 = openmc.Cell(region=-cyl1)
+    u = openmc.Universe(cells=[c1])
+    ll, ur = u.bounding_box
+    assert ur == pytest.approx((1., 1., np.inf))
+
+    # Modifying the returned arrays must not affect subsequent calls
+    ur[:] = 0.
+    assert u.bounding_box[1] == pytest.approx((1., 1., np.inf))
+
+    # Adding, replacing and removing cell regions should invalidate the cache
+    c2 = openmc.Cell(region=+cyl1 & -cyl2)
+    u.add_cell(c2)
+    assert u.bounding_box[1] == pytest.approx((2., 2., np.inf))
+    c2.region = -openmc.Sphere(r=3.0)
+    assert u.bounding_box[1] == pytest.approx((3., 3., np.inf))
+    u.remove_cell(c2)
+    assert u.bounding_box[1] == pytest.approx((1., 1., np.inf))
+    u.clear_cells()
+    assert_unbounded(u)
+
+    # Modifying surfaces or regions in place should invalidate the cache
+    sph = openmc.Sphere(r=1.0)
+    c3 = openmc.Cell(region=-sph | -openmc.Sphere(x0=5.0, r=1.0))
+    u.add_cell(c3)
+    assert u.bounding_box[0] == pytest.approx((-1., -1., -1.))
+    sph.r = 2.0
+    assert u.bounding_box[0] == pytest.approx((-2., -2., -2.))
+    c3.region |= -openmc.Sphere(x0=-10.0, r=1.0)
+    assert u.bounding_box[0] == pytest.approx((-11., -2., -2.))
+
+
+def test_geometry_revision(uo2):
+    # Creating new geometry objects does not invalidate cached data
+    revision = openmc.GeometryRevision.value
+    sph = openmc.Sphere(r=1.0)
+    x0, x1 = openmc.XPlane(-1.0), openmc.XPlane(1.0)
+    region = +x0 & -x1 & -sph
+    region = region & region
+    region = (+x0 | -sph) | (-x1 | region)
+    cell = openmc.Cell(fill=uo2, region=~region)
+    openmc.Universe(cells=[cell, openmc.Cell()])
+    assert openmc.GeometryRevision.value == revision
+
+    # Modifying existing objects does
+    for modify in (lambda: setattr(sph, 'r', 2.0),
+                   lambda: setattr(cell, 'fill', None),
+                   lambda: region.append(-sph)):
+        modify()
+        assert openmc.GeometryRevision.value > revision
+        revision = openmc.GeometryRevision.value
+
+
+@pytest.mark.parametrize('min_cells', [0, 1000])
+def test_find(min_cells, monkeypatch):
+    # Cells are screened with a bounding volume hierarchy or checked in turn
+    monkeypatch.setattr(openmc.universe, '_BVH_MIN_CELLS', min_cells)
+
+    # Row of slabs with an unbounded cell covering everything else
+    planes = [openmc.XPlane(x) for x in range(11)]
+    slabs = [openmc.Cell(region=+p1 & -p2)
+             for p1, p2 in zip(planes[:-1], planes[1:])]
+    outside = openmc.Cell(region=-planes[0] | +planes[-1])
+    u = openmc.Universe(cells=slabs + [outside])
+
+    for i, cell in enumerate(slabs):
+        assert u.find((i + 0.5, 0., 0.)) == [u, cell]
+    assert u.find((-5., 0., 0.)) == [u, outside]
+    assert u.find((15., 1., 1.)) == [u, outside]
+
+    # Changing a region or the cells should be reflected in subsequent finds
+    slabs[0].region = +planes[0] & -planes[2]
+    u.remove_cell(slabs[1])
+    assert u.find((1.5, 0., 0.)) == [u, slabs[0]]
+    inner = openmc.Cell()
+    u.clear_cells()
+    u.add_cell(inner)
+    assert u.find((1.5, 0., 0.)) == [u, inner]
+
+    # Modifying surfaces or regions in place after a find
+    sph = openmc.Sphere(r=1.0)
+    c = openmc.Cell(region=-sph | -openmc.Sphere(x0=5.0, r=1.0))
+    u = openmc.Universe(cells=[c])
+    assert u.find((0., 0., 1.5)) == []
+    sph.r = 2.0
+    assert u.find((0., 0., 1.5)) == [u, c]
+    c.region |= -openmc.Sphere(x0=-10.0, r=1.0)
+    assert u.find((-10., 0., 0.)) == [u, c]
+
+
+def test_find_batch(uo2):
+    cyl = openmc.ZCylinder(r=1.0)
+    fuel = openmc.Cell(fill=uo2, region=-cyl)
+    moderator = openmc.Cell(region=+cyl)
+    pin = openmc.Universe(cells=[fuel, moderator])
+
+    # Translated and rotated pin inside a box
+    sph = openmc.Sphere(r=10.0)
+    holder = openmc.Cell(fill=pin, region=-sph)
+    holder.translation = (2., 0., 0.)
+    holder.rotation = (0., 90., 0.)
+    outside = openmc.Cell(region=+sph)
+    u = openmc.Universe(cells=[holder, outside])
+
+    points = np.array([[2., 0., 0.], [7., 0., 0.], [2., 0., 5.], [0., 0., 20.]])
+    paths = u.find_batch(points)
+    assert paths == [u.find(tuple(p)) for p in points]
+    assert paths[0][-1] is fuel
+    assert paths[1][-1] is fuel
+    assert paths[2][-1] is moderator
+    assert paths[3] == [u, outside]
+
+    # Input points must be left untouched
+    assert points[0] == pytest.approx((2., 0., 0.))
+    u.find(points[0])
+    assert points[0] == pytest.approx((2., 0., 0.))
+
+    # Changing the translation must be reflected in subsequent finds
+    holder.translation = (7., 0., 0.)
+    assert u.find((2., 0., 0.))[-1] is fuel
+    assert u.find((7., 0., 0.))[-1] is fuel
+    assert u.find((7., 0., 5.))[-1] is moderator
+
+
 def test_plot(run_in_tmpdir, sphere_model):
     m = sphere_model.materials[0]
     univ = sphere_model.geometry.root_universe
@@ -62,12 +189,17 @@ def test_plot(run_in_tmpdir, sphere_model):
         )
 
 
-def test_get_nuclides(uo2):
+def test_get_nuclides(uo2, water):
     c = openmc.Cell(fill=uo2)
     univ = openmc.Universe(cells=[c])
     nucs = univ.get_nuclides()
     assert nucs == ['U235', 'O16']
 
+    # Nuclides appearing in several cells are only listed once
+    univ.add_cells([openmc.Cell(fill=water), openmc.Cell(fill=uo2),
+                    openmc.Cell()])
+    assert univ.get_nuclides() == ['U235', 'O16', 'H1']
+
 
 def test_cells():
     cells = [openmc.Cell() for i in range(5)]
@@ -136,6 +268,8 @@ def test_clone():
     dagmc_u.auto_geom_ids = True
     dagmc_u.auto_mat_ids = True
     dagmc_u1 = dagmc_u.clone()
+    assert dagmc_u1.id != dagmc_u.id
+    assert dagmc_u1.filename == dagmc_u.filename
     assert dagmc_u1.name == dagmc_u.name
     assert dagmc_u1.volume == dagmc_u.volume
     assert dagmc_u1.auto_geom_ids == dagmc_u.auto_geom_ids
@@ -174,3 +308,100 @@ def test_get_nuclide_densities():
     universe = openmc.Universe(cells=[cell])
     with pytest.raises(RuntimeError):
         universe.get_nuclide_densities()
+
+
+def test_get_all_cells_cache(uo2, water):
+    inner = openmc.Cell(fill=uo2)
+    u1 = openmc.Universe(cells=[inner])
+    outer = openmc.Cell(fill=u1)
+    u2 = openmc.Universe(cells=[outer])
+    assert list(u2.get_all_cells().values()) == [outer, inner]
+    assert list(u2.get_all_materials().values()) == [uo2]
+
+    # Returned dictionaries can be modified without affecting the cache
+    u2.get_all_cells().clear()
+    assert list(u2.get_all_cells().values()) == [outer, inner]
+
+    # Changes in nested universes and fills must be reflected
+    extra = openmc.Cell(fill=water)
+    u1.add_cell(extra)
+    assert list(u2.get_all_cells().values()) == [outer, inner, extra]
+    assert list(u2.get_all_materials().values()) == [uo2, water]
+    inner.fill = None
+    assert list(u2.get_all_materials().values()) == [water]
+    u1.remove_cell(extra)
+    assert list(u2.get_all_cells().values()) == [outer, inner]
+
+    # Changed IDs must be reflected in the keys
+    inner.id = 12345
+    assert 12345 in u2.get_all_cells()
+
+    # A memo passed in is filled with the visited objects
+    memo = set()
+    u2.get_all_cells(memo)
+    assert {u2, outer, u1, inner} <= memo
+
+
+def test_from_hdf5(run_in_tmpdir):
+    cells = {i: openmc.Cell(cell_id=i) for i in (21, 22, 23)}
+    with h5py.File('universes.h5', 'w') as f:
+        group = f.create_group('geometry/universes/universe 17')
+        group.create_dataset('cells', data=[23, 21])
+        u = openmc.Universe.from_hdf5(group, cells)
+
+    assert u.id == 17
+    assert list(u.cells) == [23, 21]
+    assert list(u.cells.values()) == [cells[23], cells[21]]
+    assert u.find((0., 0., 0.)) == [u, cells[23]]
+
+
+def test_dagmc_from_hdf5(run_in_tmpdir):
+    with h5py.File('universes.h5', 'w') as f:
+        for uid in (5, 6):
+            group = f.create_group(f'geometry/universes/universe {uid}')
+            group.create_dataset('filename', data=b'dagmc.h5m')
+            group.create_dataset('name', data=b'dag')
+            group.attrs['auto_geom_ids'] = 1
+            group.attrs['auto_mat_ids'] = 0
+
+        str_memo = {}
+        u5, u6 = (openmc.DAGMCUniverse.from_hdf5(group, str_memo)
+                  for group in f['geometry/universes'].values())
+
+    assert (u5.id, u6.id) == (5, 6)
+    assert u5.filename == 'dagmc.h5m'
+    assert u5.name == 'dag'
+    assert u5.auto_geom_ids and not u5.auto_mat_ids
+
+    # Strings read with a shared memo are shared between universes
+    assert u5.filename is u6.filename
+    assert u5.name is u6.name
+
+
+def test_dagmc_from_xml_element():
+    elem = ET.fromstring('<dagmc_universe id="8" filename="dagmc.h5m" '
+                         'auto_geom_ids="True" auto_mat_ids="false"/>')
+    u = openmc.DAGMCUniverse.from_xml_element(elem)
+    assert u.id == 8
+    assert u.filename == 'dagmc.h5m'
+    assert u.name == ''
+    assert u.auto_geom_ids
+    assert not u.auto_mat_ids
+
+    # Values can also be given as subelements
+    elem = ET.fromstring('<dagmc_universe id="9"><filename>dagmc.h5m</filename>'
+                         '<name>dag</name></dagmc_universe>')
+    u = openmc.DAGMCUniverse.from_xml_element(elem)
+    assert (u.id, u.filename, u.name) == (9, 'dagmc.h5m', 'dag')
+    assert not u.auto_geom_ids and not u.auto_mat_ids
+
+    # Flags are interpreted the same way as by the OpenMC executable
+    for value, expected in [('1', True), ('yes', True), ('0', False),
+                            ('no', False), ('', False)]:
+        elem = ET.fromstring(
+            f'<dagmc_universe id="10" filename="dagmc.h5m" '
+            f'auto_geom_ids="{value}"><auto_mat_ids>{value}</auto_mat_ids>'
+            '</dagmc_universe>')
+        u = openmc.DAGMCUniverse.from_xml_element(elem)
+        assert u.auto_geom_ids == expected
+        assert u.auto_mat_ids == expected
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare the time taken by Universe.find with and without the bounding
+volume hierarchy used to screen cells.
+
+The hierarchy is only used for universes with at least
+openmc.universe._BVH_MIN_CELLS cells. This script times point searches with
+that threshold as set and with the hierarchy disabled, which corresponds to
+checking each cell in turn, for a full PWR core model and for universes made
+of a row of slabs.
+
+"""
+import argparse
+import timeit
+import warnings
+
+import numpy as np
+
+import openmc
+import openmc.examples
+import openmc.universe
+
+
+def slab_universe(n):
+    """Create a universe with a row of n slabs and a cell covering the rest"""
+    planes = [openmc.XPlane(x) for x in range(n + 1)]
+    cells = [openmc.Cell(region=+p1 & -p2)
+             for p1, p2 in zip(planes[:-1], planes[1:])]
+    cells.append(openmc.Cell(region=-planes[0] | +planes[-1]))
+    points = [(x, 0., 0.) for x in np.linspace(-1., n + 1., 50)]
+    return openmc.Universe(cells=cells), points
+
+
+def time_find(universe, points, repeat):
+    """Return the minimum time in seconds taken to find all points"""
+    universe.find(points[0])
+    return min(timeit.repeat(lambda: [universe.find(p) for p in points],
+                             number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', '--points', type=int, default=300,
+                        help='Number of random points in the PWR core')
+    parser.add_argument('-r', '--repeat', type=int, default=10,
+                        help='Number of times each measurement is repeated')
+    args = parser.parse_args()
+
+    warnings.simplefilter('ignore', openmc.IDWarning)
+    cases = {}
+    root = openmc.examples.pwr_core().geometry.root_universe
+    rng = np.random.default_rng(1)
+    cases['pwr_core'] = (root, rng.uniform(-150., 150., (args.points, 3)))
+    for n in (3, 30, 300):
+        cases[f'{n} slabs'] = slab_universe(n)
+
+    min_cells = openmc.universe._BVH_MIN_CELLS
+    print(f'{"case":<12}{"linear [s]":>14}{"default [s]":>14}{"ratio":>8}')
+    for name, (universe, points) in cases.items():
+        openmc.universe._BVH_MIN_CELLS = np.inf
+        linear = time_find(universe, points, args.repeat)
+        openmc.universe._BVH_MIN_CELLS = min_cells
+        default = time_find(universe, points, args.repeat)
+        print(f'{name:<12}{linear:>14.3e}{default:>14.3e}'
+              f'{linear/default:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()